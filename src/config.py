@@ -1,2 +1,24 @@
+import os
+
 COMMIT_COLUMNS = ["sha", "author", "email", "date", "message"]
-ISSUE_COLUMNS = ["id", "number", "title", "user", "state", "created_at", "closed_at", "open_duration_days", "comments"]
\ No newline at end of file
+ISSUE_COLUMNS = ["id", "number", "title", "user", "state", "created_at", "closed_at", "open_duration_days", "comments"]
+
+# Schemas for reading the CSVs back (pyarrow-backed; date columns are parsed as timestamps)
+COMMIT_DTYPES = {"sha": "string[pyarrow]", "author": "string[pyarrow]", "email": "string[pyarrow]",
+                 "message": "string[pyarrow]"}
+COMMIT_DATE_COLUMNS = ["date"]
+ISSUE_DTYPES = {"id": "int64[pyarrow]", "number": "int64[pyarrow]", "title": "string[pyarrow]",
+                "user": "string[pyarrow]", "state": "string[pyarrow]",
+                "open_duration_days": "double[pyarrow]", "comments": "int64[pyarrow]"}
+ISSUE_DATE_COLUMNS = ["created_at", "closed_at"]
+
+# GitHub REST API settings
+GITHUB_API_URL = "https://api.github.com"
+PER_PAGE = 100          # max page size GitHub allows on list endpoints
+MAX_CONCURRENCY = 64    # max in-flight requests to the API host
+KEEPALIVE_TIMEOUT = 30  # seconds an idle pooled connection is kept open
+RATE_LIMIT_THRESHOLD = 100  # below this many remaining requests, concurrency is throttled
+MAX_RETRIES = 5         # retries of a rate-limited request before giving up
+
+# On-disk cache of ETag-tagged responses (enabled with --cache)
+ETAG_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "repo_miner", "etags.json")
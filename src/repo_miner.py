@@ -9,20 +9,483 @@ A command-line tool to:
 Sub-commands:
   - fetch-commits
   - fetch-issues
+  - fetch-all
   - summarize
 """
 
 import os
 import argparse
+import asyncio
+import contextlib
+import csv
+import functools
+import json
 import sys
+import time
+from itertools import islice
+import aiohttp
+import numpy as np
 import pandas as pd
-from github import Github
-from github.Auth import Token
 
 # Ensure src/ is on sys.path for imports (fixes some issue when running tests)
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from config import COMMIT_COLUMNS, ISSUE_COLUMNS
+from config import (COMMIT_COLUMNS, ISSUE_COLUMNS, COMMIT_DTYPES, COMMIT_DATE_COLUMNS, ISSUE_DTYPES,
+                    ISSUE_DATE_COLUMNS, GITHUB_API_URL, PER_PAGE, MAX_CONCURRENCY,
+                    KEEPALIVE_TIMEOUT, RATE_LIMIT_THRESHOLD, MAX_RETRIES, ETAG_CACHE_PATH)
+
+class EtagCache:
+    """
+    On-disk cache of GitHub list pages keyed by request URL.
+    Cached pages are revalidated with `If-None-Match`; GitHub answers an
+    unchanged page with a bodiless 304 (which doesn't count against the rate
+    limit) and the cached items are reused.
+    """
+    def __init__(self, path: str = ETAG_CACHE_PATH):
+        self.path = path
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                self._entries = json.load(cache_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._entries = {}
+
+    @staticmethod
+    def key(url: str, params: dict) -> str:
+        """
+        Cache key for a request: its URL with the query params in a stable order.
+        """
+        return url + "?" + "&".join(f"{name}={value}" for name, value in sorted(params.items()))
+
+    def get(self, key: str):
+        """
+        Return the cached entry (etag, items, last_page, next_url) for `key`, or None.
+        """
+        return self._entries.get(key)
+
+    def put(self, key: str, etag: str, items: list, last_page: int, next_url: str = None) -> None:
+        """
+        Store a freshly downloaded page under `key`.
+        """
+        self._entries[key] = {"etag": etag, "items": items, "last_page": last_page, "next_url": next_url}
+
+    def save(self) -> None:
+        """
+        Write the cache back to disk.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as cache_file:
+            json.dump(self._entries, cache_file)
+
+# ETag cache used by all requests; None (disabled) unless enable_etag_cache() is called
+_etag_cache = None
+
+def enable_etag_cache(path: str = ETAG_CACHE_PATH) -> EtagCache:
+    """
+    Turn on the on-disk ETag cache at `path` for all subsequent fetches.
+    """
+    global _etag_cache
+    _etag_cache = EtagCache(path)
+    return _etag_cache
+
+def get_session(github_token: str = None) -> aiohttp.ClientSession:
+    """
+    Create the pooled aiohttp session used for GitHub REST calls.
+    Connections are kept alive and reused by every request made through the
+    session, so share one session across fetches where possible.
+    Authenticates with `github_token` when given.
+    """
+    headers = {"Accept": "application/vnd.github+json"}
+    if github_token:
+        headers["Authorization"] = f"Bearer {github_token}"
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENCY, limit_per_host=MAX_CONCURRENCY,
+                                     keepalive_timeout=KEEPALIVE_TIMEOUT)
+    return aiohttp.ClientSession(headers=headers, connector=connector)
+
+async def _with_session(github_token: str, fetch, *args):
+    """
+    Run `fetch(session, *args)` with a fresh session, closing it afterwards.
+    """
+    async with get_session(github_token) as session:
+        try:
+            return await fetch(session, *args)
+        finally:
+            if _etag_cache is not None:
+                _etag_cache.save()
+
+class RateLimiter:
+    """
+    Adaptive limiter shared by concurrent GitHub REST requests.
+    Caps the number of requests in flight, shrinking the cap to the remaining
+    budget once `X-RateLimit-Remaining` drops below RATE_LIMIT_THRESHOLD, and
+    pauses every request while GitHub asks clients to back off.
+    """
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self.resume_at = 0.0
+        self._in_flight = 0
+        self._slot_freed = asyncio.Condition()
+
+    async def __aenter__(self):
+        # Wait for a free slot, then for any back-off pause to run out
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        delay = self.resume_at - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        async with self._slot_freed:
+            self._in_flight -= 1
+            self._slot_freed.notify_all()
+
+    def update(self, headers) -> None:
+        """
+        Adjust the concurrency cap from a response's rate-limit headers.
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        remaining = int(remaining)
+        if remaining < RATE_LIMIT_THRESHOLD:
+            self.limit = max(1, min(self.max_concurrency, remaining))
+        else:
+            self.limit = self.max_concurrency
+        # Budget spent: hold everything until the window resets
+        if remaining == 0 and headers.get("X-RateLimit-Reset"):
+            self.pause(int(headers["X-RateLimit-Reset"]) - time.time())
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold all requests for `seconds` from now.
+        """
+        self.resume_at = max(self.resume_at, time.time() + seconds)
+
+def _retry_delay(resp: aiohttp.ClientResponse, attempt: int):
+    """
+    Seconds to back off before retrying a rate-limited response, or None if
+    the response wasn't rate limited.
+    """
+    if "Retry-After" in resp.headers:
+        return int(resp.headers["Retry-After"])
+    if resp.status == 429 or resp.headers.get("X-RateLimit-Remaining") == "0":
+        # Primary limit resets at a known time; otherwise back off exponentially
+        if resp.headers.get("X-RateLimit-Reset"):
+            return max(0, int(resp.headers["X-RateLimit-Reset"]) - time.time())
+        return 2 ** attempt
+    return None
+
+async def _get_page(session: aiohttp.ClientSession, url: str, params: dict,
+                    limiter: RateLimiter) -> tuple[list, int, str]:
+    """
+    GET a single page of a GitHub list endpoint, retrying when rate limited.
+    Returns the decoded JSON items, the last page number advertised in the
+    `Link` header and the URL of the next page (each None if not advertised).
+    With the ETag cache enabled, the page is only re-downloaded if it changed.
+    """
+    cache_key = EtagCache.key(url, params)
+    cached = _etag_cache.get(cache_key) if _etag_cache is not None else None
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+
+    for attempt in range(MAX_RETRIES + 1):
+        async with limiter:
+            async with session.get(url, params=params, headers=headers) as resp:
+                limiter.update(resp.headers)
+                if resp.status == 304 and cached:
+                    return cached["items"], cached["last_page"], cached.get("next_url")
+                if resp.status in (403, 429) and attempt < MAX_RETRIES:
+                    delay = _retry_delay(resp, attempt)
+                    if delay is not None:
+                        print(f"Rate limited by GitHub, retrying in {delay:.0f}s...")
+                        limiter.pause(delay)
+                        continue
+                if resp.status == 404:
+                    raise ValueError(f"`{url}` not found or inaccessible.")
+                resp.raise_for_status()
+                items = await resp.json()
+                last = resp.links.get("last")
+                last_page = int(last["url"].query["page"]) if last else None
+                next_link = resp.links.get("next")
+                next_url = str(next_link["url"]) if next_link else None
+                if _etag_cache is not None and "ETag" in resp.headers:
+                    _etag_cache.put(cache_key, resp.headers["ETag"], items, last_page, next_url)
+        return items, last_page, next_url
+
+async def _iter_pages(session: aiohttp.ClientSession, url: str, params: dict,
+                      limiter: RateLimiter, max_items: int = None, keep=None):
+    """
+    Yield the pages of a GitHub list endpoint, in order, as lists of items.
+    Only items passing `keep` (all, if None) are yielded, at most `max_items`.
+    Page 1 is fetched first to learn the page count from the `Link` header,
+    then the remaining pages are fetched concurrently, in waves of just
+    enough pages to cover the items still wanted.
+    Endpoints that page by cursor (like issues) advertise no last page, only a
+    `next` link, so their pages are followed one at a time.
+    """
+    if max_items is not None and max_items <= 0:
+        return
+    params = {**params, "per_page": PER_PAGE}
+    taken = 0
+
+    def take(page_items: list) -> list:
+        # Filter the page, trimmed so no more than `max_items` are yielded overall
+        nonlocal taken
+        if keep is not None:
+            page_items = filter(keep, page_items)
+        page_items = list(islice(page_items, None if max_items is None else max_items - taken))
+        taken += len(page_items)
+        return page_items
+
+    items, last_page, next_url = await _get_page(session, url, {**params, "page": 1}, limiter)
+    yield take(items)
+
+    if last_page is None:
+        # No page count advertised: follow the `next` links (which carry their own query)
+        while next_url is not None and (max_items is None or taken < max_items):
+            items, _, next_url = await _get_page(session, next_url, {}, limiter)
+            yield take(items)
+        return
+
+    page = 1
+    while page < last_page and (max_items is None or taken < max_items):
+        # Page count is known: request the next wave of pages at once
+        wave = last_page - page
+        if max_items is not None:
+            wave = min(wave, -(-(max_items - taken) // PER_PAGE)) # ceil division
+        tasks = [
+            asyncio.create_task(_get_page(session, url, {**params, "page": page + offset}, limiter))
+            for offset in range(1, wave + 1)
+        ]
+        page += wave
+        try:
+            # Hand pages out in order as they complete
+            for task in tasks:
+                items, _, _ = await task
+                yield take(items)
+        finally:
+            # Consumer stopped early (or a page failed): drop pending requests
+            for task in tasks:
+                task.cancel()
+
+async def _fetch_pages(session: aiohttp.ClientSession, url: str, params: dict,
+                       limiter: RateLimiter, max_items: int = None, keep=None) -> list:
+    """
+    Fetch the pages of a GitHub list endpoint (see `_iter_pages`) and return
+    all of their items in order.
+    """
+    items = []
+    async for page_items in _iter_pages(session, url, params, limiter, max_items, keep):
+        items.extend(page_items)
+    return items
+
+async def _fetch_commits_async(session: aiohttp.ClientSession, repo_name: str, max_commits: int = None,
+                               limiter: RateLimiter = None) -> list:
+    """
+    Fetch the raw JSON of up to `max_commits` commits of `repo_name` from the GitHub REST API.
+    Pass a shared `limiter` to throttle alongside other concurrent fetches.
+    """
+    url = f"{GITHUB_API_URL}/repos/{repo_name}/commits"
+    return await _fetch_pages(session, url, {}, limiter or RateLimiter(), max_commits)
+
+def _is_issue(issue: dict) -> bool:
+    """
+    True for real issues; GitHub marks pull requests with a `pull_request` key.
+    """
+    return "pull_request" not in issue
+
+async def _fetch_issues_async(session: aiohttp.ClientSession, repo_name: str, state: str = "all",
+                              max_issues: int = None, limiter: RateLimiter = None) -> list:
+    """
+    Fetch the raw JSON of up to `max_issues` issues of `repo_name` from the GitHub REST API.
+    Pull requests (which GitHub's issues endpoint also returns) are skipped.
+    The endpoint pages by cursor and advertises no last page, so pages are
+    fetched one after another until `max_issues` issues are seen, not in waves.
+    Pass a shared `limiter` to throttle alongside other concurrent fetches.
+    """
+    url = f"{GITHUB_API_URL}/repos/{repo_name}/issues"
+    return await _fetch_pages(session, url, {"state": state}, limiter or RateLimiter(), max_issues, _is_issue)
+
+def _parse_timestamps(timestamps: list) -> pd.DatetimeIndex:
+    """
+    Parse a column of GitHub timestamps to UTC in a single vectorized pass.
+    Missing (or unparseable) timestamps become NaT.
+    """
+    return pd.to_datetime(timestamps, utc=True, errors="coerce", format="ISO8601")
+
+def _to_iso(timestamps: pd.DatetimeIndex) -> pd.Index:
+    """
+    Format parsed UTC timestamps as ISO-8601 strings. NaT becomes None.
+    """
+    # Everything is in UTC after parsing, so the offset is always +00:00
+    iso = timestamps.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+    return iso.where(timestamps.notna(), None)
+
+@functools.lru_cache(maxsize=1)
+def _read_github_token() -> str:
+    """
+    Read the GitHub token from the GITHUB_TOKEN environment variable, once per
+    process (so the CLI and repeated fetches share it).
+    Returns None (with a warning) if it isn't set.
+    """
+    github_token = os.environ.get("GITHUB_TOKEN")
+    if not github_token:
+        print("GITHUB_TOKEN environment variable not set. Using unauthenticated requests. Rate limits may apply.")
+    return github_token
+
+def _normalize_commits(commits: list) -> dict:
+    """
+    Normalize raw commit JSON into columns: sha, author, email, date, message.
+    """
+    # The item count is known up front, so size each column once and fill by index
+    n = len(commits)
+    shas, authors, emails, dates, messages = [None] * n, [None] * n, [None] * n, [None] * n, [None] * n
+    for k, commit in enumerate(commits):
+        author = commit["commit"]["author"]
+        shas[k] = commit["sha"]
+        authors[k] = author["name"]
+        emails[k] = author["email"]
+        dates[k] = author["date"]
+        messages[k] = commit["commit"]["message"].partition('\n')[0] # first line only
+
+    return {
+        "sha": shas,
+        "author": authors,
+        "email": emails,
+        "date": _to_iso(_parse_timestamps(dates)),
+        "message": messages
+    }
+
+def _normalize_issues(issues: list) -> dict:
+    """
+    Normalize raw issue JSON (pull requests already filtered out) into columns:
+    id, number, title, user, state, created_at, closed_at, open_duration_days, comments.
+    """
+    # The item count is known up front, so size each column once and fill by index
+    n = len(issues)
+    ids, numbers, titles, users = [None] * n, [None] * n, [None] * n, [None] * n
+    states, created, closed, comments = [None] * n, [None] * n, [None] * n, [None] * n
+    for k, issue in enumerate(issues):
+        ids[k] = issue["id"]
+        numbers[k] = issue["number"]
+        titles[k] = issue["title"]
+        users[k] = issue["user"]["login"]
+        states[k] = issue["state"]
+        created[k] = issue["created_at"]
+        closed[k] = issue["closed_at"]
+        comments[k] = issue["comments"]
+
+    # Parse timestamps and derive open duration (NaN while still open), vectorized
+    created_at = _parse_timestamps(created)
+    closed_at = _parse_timestamps(closed)
+    # Always float (NaN-capable), so every page writes durations the same way (e.g. 2.0, never 2)
+    open_duration_days = (closed_at - created_at).days.astype("float64")
+
+    return {
+        "id": ids,
+        "number": numbers,
+        "title": titles,
+        "user": users,
+        "state": states,
+        "created_at": _to_iso(created_at),
+        "closed_at": _to_iso(closed_at),
+        "open_duration_days": open_duration_days,
+        "comments": comments
+    }
+
+@contextlib.contextmanager
+def _atomic_output(out_path: str):
+    """
+    Yield a temporary path next to `out_path` and move it over `out_path` only
+    if the block succeeds, so a failed fetch never clobbers an existing file.
+    """
+    tmp_path = f"{os.fspath(out_path)}.part"
+    try:
+        yield tmp_path
+        os.replace(tmp_path, out_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+async def _write_csv(pages, out_path: str, columns: list, normalize) -> int:
+    """
+    Normalize each page of raw items with `normalize` and append its rows to a
+    CSV file at `out_path` as soon as the page arrives.
+    Returns the number of rows written.
+    """
+    rows = 0
+    with open(out_path, "w", newline="", encoding="utf-8") as csv_file:
+        # Match DataFrame.to_csv: same line endings, missing values left blank
+        writer = csv.writer(csv_file, lineterminator=os.linesep)
+        writer.writerow(columns)
+        async for page_items in pages:
+            # Select columns by header name, so rows can't drift from the header if the normalizer reorders
+            cols = normalize(page_items)
+            page_columns = [
+                col.astype(object).where(col.notna(), None) if isinstance(col, pd.Index) else col
+                for col in (cols[name] for name in columns)
+            ]
+            writer.writerows(zip(*page_columns))
+            rows += len(page_columns[0])
+    return rows
+
+async def _fetch_commits_to_csv_async(session: aiohttp.ClientSession, repo_name: str,
+                                      max_commits: int, out_path: str, limiter: RateLimiter = None) -> int:
+    """
+    Stream up to `max_commits` commits of `repo_name` to a CSV file, page by page.
+    """
+    url = f"{GITHUB_API_URL}/repos/{repo_name}/commits"
+    pages = _iter_pages(session, url, {}, limiter or RateLimiter(), max_commits)
+    return await _write_csv(pages, out_path, COMMIT_COLUMNS, _normalize_commits)
+
+async def _fetch_issues_to_csv_async(session: aiohttp.ClientSession, repo_name: str, state: str,
+                                     max_issues: int, out_path: str, limiter: RateLimiter = None) -> int:
+    """
+    Stream up to `max_issues` issues of `repo_name` to a CSV file, page by page.
+    """
+    url = f"{GITHUB_API_URL}/repos/{repo_name}/issues"
+    pages = _iter_pages(session, url, {"state": state}, limiter or RateLimiter(), max_issues, _is_issue)
+    return await _write_csv(pages, out_path, ISSUE_COLUMNS, _normalize_issues)
+
+async def _fetch_all_to_csv_async(session: aiohttp.ClientSession, repo_name: str, state: str,
+                                  max_commits: int, max_issues: int,
+                                  commits_out: str, issues_out: str) -> tuple:
+    """
+    Stream commits and issues of `repo_name` to their CSV files concurrently,
+    sharing one session and one rate limiter (the API budget is per token).
+    """
+    limiter = RateLimiter()
+    tasks = [
+        asyncio.create_task(_fetch_commits_to_csv_async(session, repo_name, max_commits, commits_out, limiter)),
+        asyncio.create_task(_fetch_issues_to_csv_async(session, repo_name, state, max_issues, issues_out, limiter)),
+    ]
+    try:
+        return tuple(await asyncio.gather(*tasks))
+    finally:
+        # One fetch failed: stop the other now rather than at event loop teardown
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+@functools.lru_cache(maxsize=16)
+def _fetch_commits_cached(repo_name: str, max_commits: int = None) -> tuple:
+    """
+    Fetch and normalize commits once per (repo_name, max_commits) and memoize
+    the result as a tuple of column tuples in COMMIT_COLUMNS order.
+    Callers that don't need a DataFrame can use the columns directly.
+    """
+    # 1) Read GitHub token from environment
+    github_token = _read_github_token()
+
+    # 2) Fetch raw commit JSON (only the pages needed, requested concurrently)
+    print(f"Fetching commits from `{repo_name}`...")
+    commits = asyncio.run(_with_session(github_token, _fetch_commits_async, repo_name, max_commits))
+
+    # 3) Normalize commits column-wise
+    print("Normalizing commit data...")
+    columns = _normalize_commits(commits)
+    return tuple(tuple(columns[name]) for name in COMMIT_COLUMNS)
 
 def fetch_commits(repo_name: str, max_commits: int = None) -> pd.DataFrame:
     """
@@ -32,122 +495,105 @@ def fetch_commits(repo_name: str, max_commits: int = None) -> pd.DataFrame:
     # Handle edge case of max_commits <= 0
     if max_commits is not None and max_commits <= 0:
         return pd.DataFrame(columns=COMMIT_COLUMNS)
+
+    # Build DataFrame in one shot from the (possibly memoized) columns
+    commit_df: pd.DataFrame = pd.DataFrame(dict(zip(COMMIT_COLUMNS, _fetch_commits_cached(repo_name, max_commits))))
     
-    # 1) Read GitHub token from environment
-    github_token = os.environ.get("GITHUB_TOKEN")
-    if not github_token:
-        print("GITHUB_TOKEN environment variable not set. Using unauthenticated requests. Rate limits may apply.")
-    
-    # 2) Initialize GitHub client and get the repo
-    g = Github(auth=Token(github_token)) if github_token else Github()
-    
-    repo = g.get_repo(repo_name)
-    if not repo:
-        raise ValueError(f"Repository `{repo_name}` not found or inaccessible.")
+    return commit_df
 
-    # 3) Fetch commit objects (paginated by PyGitHub)
+def fetch_commits_to_csv(repo_name: str, max_commits: int = None, out_path: str = "commits.csv") -> int:
+    """
+    Fetch up to `max_commits` from the specified GitHub repository and stream
+    them to a CSV file at `out_path` as pages arrive, without building a DataFrame.
+    `out_path` is only replaced once the whole fetch succeeds.
+    Returns the number of commits written.
+    """
+    github_token = _read_github_token()
     print(f"Fetching commits from `{repo_name}`...")
-    commits = repo.get_commits()
-    if max_commits is not None:
-        commits = commits[:max_commits]
+    with _atomic_output(out_path) as tmp_path:
+        return asyncio.run(_with_session(github_token, _fetch_commits_to_csv_async, repo_name, max_commits, tmp_path))
 
-    # 4) Normalize each commit into a record dict
-    print("Normalizing commit data...")
-    normalized_commits = []
-    for commit in commits:
-        record = {
-            "sha": commit.sha,
-            "author": commit.commit.author.name,
-            "email": commit.commit.author.email,
-            "date": commit.commit.author.date.isoformat() if commit.commit.author.date else None,
-            "message": commit.commit.message.split('\n', 1)[0] # first line only
-        }
-        normalized_commits.append(record)
-
-    # 5) Build DataFrame from records
-    commit_df: pd.DataFrame = pd.DataFrame(normalized_commits, columns=COMMIT_COLUMNS)
-    
-    # Close GitHub client (not strictly necessary)
-    g.close()
-    
-    return commit_df
+@functools.lru_cache(maxsize=16)
+def _fetch_issues_cached(repo_name: str, state: str = "all", max_issues: int = None) -> tuple:
+    """
+    Fetch and normalize issues once per (repo_name, state, max_issues) and
+    memoize the result as a tuple of column tuples in ISSUE_COLUMNS order.
+    """
+    # 1) Read GitHub token from environment
+    github_token = _read_github_token()
+
+    # 2) Fetch raw issue JSON, filtered by state ('all', 'open', 'closed')
+    issues = asyncio.run(_with_session(github_token, _fetch_issues_async, repo_name, state, max_issues))
+
+    # 3) Normalize issues (skip PRs) column-wise
+    columns = _normalize_issues(issues)
+    return tuple(tuple(columns[name]) for name in ISSUE_COLUMNS)
 
 def fetch_issues(repo_name: str, state: str = "all", max_issues: int = None) -> pd.DataFrame:
     """
     Fetch up to `max_issues` from the specified GitHub repository (issues only).
     Returns a DataFrame with columns: id, number, title, user, state, created_at, closed_at, open_duration_days, comments.
     """
-    # 1) Read GitHub token from environment
-    github_token = os.environ.get("GITHUB_TOKEN")
-    if not github_token:
-        print("GITHUB_TOKEN environment variable not set. Using unauthenticated requests. Rate limits may apply.")
-    
-    # 2) Initialize GitHub client and get the repo
-    g = Github(auth=Token(github_token)) if github_token else Github()
-    
-    repo = g.get_repo(repo_name)
-    if not repo:
-        raise ValueError(f"Repository `{repo_name}` not found or inaccessible.")
-
-    # 3) Fetch issues, filtered by state ('all', 'open', 'closed')
-    issues = repo.get_issues(state=state)
-
-    # 4) Normalize each issue (skip PRs)
-    records = []
-    for idx, issue in enumerate(issues):
-        if max_issues and idx >= max_issues:
-            break
-        # Skip pull requests
-        if issue.pull_request is not None:
-            continue
-
-        # Append records
-        records.append({
-            "id": issue.id,
-            "number": issue.number,
-            "title": issue.title,
-            "user": issue.user.login,
-            "state": issue.state,
-            "created_at": issue.created_at.isoformat() if issue.created_at else None,
-            "closed_at": issue.closed_at.isoformat() if issue.closed_at else None,
-            "open_duration_days": (issue.closed_at - issue.created_at).days if issue.closed_at else None,
-            "comments": issue.comments
-        })
-
-    # 5) Build DataFrame
-    issue_df = pd.DataFrame(records, columns=ISSUE_COLUMNS)
-    g.close()
+    # Build DataFrame in one shot from the (possibly memoized) columns
+    issue_df = pd.DataFrame(dict(zip(ISSUE_COLUMNS, _fetch_issues_cached(repo_name, state, max_issues or None))))
     return issue_df
 
+def fetch_issues_to_csv(repo_name: str, state: str = "all", max_issues: int = None,
+                        out_path: str = "issues.csv") -> int:
+    """
+    Fetch up to `max_issues` from the specified GitHub repository (issues only)
+    and stream them to a CSV file at `out_path` as pages arrive, without
+    building a DataFrame. `out_path` is only replaced once the whole fetch
+    succeeds. Returns the number of issues written.
+    """
+    github_token = _read_github_token()
+    with _atomic_output(out_path) as tmp_path:
+        return asyncio.run(_with_session(github_token, _fetch_issues_to_csv_async, repo_name, state,
+                                         max_issues or None, tmp_path))
+
+def fetch_all_to_csv(repo_name: str, state: str = "all", max_commits: int = None, max_issues: int = None,
+                     commits_out: str = "commits.csv", issues_out: str = "issues.csv") -> tuple:
+    """
+    Fetch commits and issues (issues only) from the specified GitHub repository
+    at the same time, streaming each to its CSV file. Both files are only
+    replaced once both fetches succeed.
+    Returns the numbers of (commits, issues) written.
+    """
+    github_token = _read_github_token()
+    print(f"Fetching commits and issues from `{repo_name}`...")
+    # Neither output is replaced unless both fetches succeed
+    with _atomic_output(commits_out) as commits_tmp, _atomic_output(issues_out) as issues_tmp:
+        return asyncio.run(_with_session(github_token, _fetch_all_to_csv_async, repo_name, state,
+                                         max_commits, max_issues or None, commits_tmp, issues_tmp))
+
 def merge_and_summarize(commits_df: pd.DataFrame, issues_df: pd.DataFrame) -> None:
     """
     Takes two DataFrames (commits and issues) and prints:
-      - Top 5 committers by commit count
+      - Top 5 committers by commit count (ties in order of first appearance)
       - Issue close rate (closed/total)
       - Average open duration for closed issues (in days)
     """
-    # Copy to avoid modifying original data
-    commits = commits_df.copy()
-    issues  = issues_df.copy()
-
-    # 1) Normalize date/time columns to pandas datetime
-    commits['date']      = pd.to_datetime(commits['date'], errors='coerce')
-    issues['created_at'] = pd.to_datetime(issues['created_at'], errors='coerce')
-    issues['closed_at']  = pd.to_datetime(issues['closed_at'], errors='coerce')
-
-    # 2) Top 5 committers
-    top_committers = commits['author'].value_counts().head(5)
+    # 1) Top 5 committers
+    # Counts stay in first-appearance order, so tied authors are listed as they first appear in the log
+    top_committers = commits_df['author'].value_counts(sort=False).nlargest(5)
     print("Top 5 committers:")
     for author, count in top_committers.items():
         print(f"\t{author}: {count} commits")
 
-    # 3) Calculate issue close rate
-    closed_issues = issues[issues['state'] == 'closed']
-    issue_close_rate = len(closed_issues) / len(issues) if not issues.empty else 0
+    # 2) Calculate issue close rate (one boolean mask, reused below instead of slicing the frame)
+    is_closed = issues_df['state'].eq('closed').to_numpy(dtype=bool, na_value=False)
+    n_closed = is_closed.sum()
+    issue_close_rate = n_closed / len(issues_df) if len(issues_df) else 0
     print(f"Issue close rate: {issue_close_rate:.2f}")
 
-    # 4) Compute average open duration (days) for closed issues
-    avg_open_duration = closed_issues['open_duration_days'].mean() if not closed_issues.empty else 0
+    # 3) Compute average open duration (days) for closed issues
+    durations = issues_df['open_duration_days'].to_numpy(dtype=float, na_value=np.nan)[is_closed]
+    durations = durations[~np.isnan(durations)]
+    if durations.size:
+        avg_open_duration = durations.mean()
+    else:
+        # No closed issues -> 0; closed issues with only blank durations -> NaN, as Series.mean() gave
+        avg_open_duration = np.nan if n_closed else 0
     print(f"Avg. issue open duration: {avg_open_duration:.2f} days")
 
 def main():
@@ -166,6 +612,8 @@ def main():
     c1.add_argument("--max",  type=int, dest="max_commits",
                     help="Max number of commits to fetch")
     c1.add_argument("--out",  required=True, help="Path to output commits CSV")
+    c1.add_argument("--cache", action="store_true",
+                    help="Reuse unchanged pages from the on-disk ETag cache")
 
     # Sub-command: fetch-issues
     c2 = subparsers.add_parser("fetch-issues", help="Fetch issues and save to CSV")
@@ -175,6 +623,22 @@ def main():
     c2.add_argument("--max",   type=int, dest="max_issues",
                     help="Max number of issues to fetch")
     c2.add_argument("--out",   required=True, help="Path to output issues CSV")
+    c2.add_argument("--cache", action="store_true",
+                    help="Reuse unchanged pages from the on-disk ETag cache")
+
+    # Sub-command: fetch-all (commits and issues fetched concurrently)
+    c4 = subparsers.add_parser("fetch-all", help="Fetch commits and issues concurrently and save both CSVs")
+    c4.add_argument("--repo",  required=True, help="Repository in owner/repo format")
+    c4.add_argument("--state", choices=["all","open","closed"], default="all",
+                    help="Filter issues by state")
+    c4.add_argument("--max-commits", type=int, dest="max_commits",
+                    help="Max number of commits to fetch")
+    c4.add_argument("--max-issues",  type=int, dest="max_issues",
+                    help="Max number of issues to fetch")
+    c4.add_argument("--commits-out", required=True, help="Path to output commits CSV")
+    c4.add_argument("--issues-out",  required=True, help="Path to output issues CSV")
+    c4.add_argument("--cache", action="store_true",
+                    help="Reuse unchanged pages from the on-disk ETag cache")
 
     # Sub-command: summarize
     c3 = subparsers.add_parser("summarize", help="Summarize commits and issues")
@@ -182,22 +646,32 @@ def main():
     c3.add_argument("--issues",  required=True, help="Path to issues CSV file")
 
     args = parser.parse_args()
+
+    # Conditional requests against the on-disk cache, if requested
+    if getattr(args, "cache", False):
+        enable_etag_cache()
     
     # Dispatch based on selected command
     if args.command == "fetch-commits":
-        df = fetch_commits(args.repo, args.max_commits)
-        df.to_csv(args.out, index=False)
-        print(f"Saved {len(df)} commits to {args.out}")
+        count = fetch_commits_to_csv(args.repo, args.max_commits, args.out)
+        print(f"Saved {count} commits to {args.out}")
 
     elif args.command == "fetch-issues":
-        df = fetch_issues(args.repo, args.state, args.max_issues)
-        df.to_csv(args.out, index=False)
-        print(f"Saved {len(df)} issues to {args.out}")
+        count = fetch_issues_to_csv(args.repo, args.state, args.max_issues, args.out)
+        print(f"Saved {count} issues to {args.out}")
+
+    elif args.command == "fetch-all":
+        commit_count, issue_count = fetch_all_to_csv(args.repo, args.state, args.max_commits, args.max_issues,
+                                                     args.commits_out, args.issues_out)
+        print(f"Saved {commit_count} commits to {args.commits_out}")
+        print(f"Saved {issue_count} issues to {args.issues_out}")
 
     elif args.command == "summarize":
-        # Read CSVs into DataFrames
-        commits_df = pd.read_csv(args.commits)
-        issues_df  = pd.read_csv(args.issues)
+        # Read CSVs into DataFrames (Arrow's native reader parses types and dates in one pass)
+        commits_df = pd.read_csv(args.commits, engine="pyarrow", dtype_backend="pyarrow",
+                                 dtype=COMMIT_DTYPES, parse_dates=COMMIT_DATE_COLUMNS)
+        issues_df  = pd.read_csv(args.issues, engine="pyarrow", dtype_backend="pyarrow",
+                                 dtype=ISSUE_DTYPES, parse_dates=ISSUE_DATE_COLUMNS)
         # Generate and print the summary
         merge_and_summarize(commits_df, issues_df)
 
@@ -0,0 +1,106 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from vcr.persisters.filesystem import FilesystemPersister
+from vcr.serializers import jsonserializer
+
+from tests.dummies import DummyGithub
+
+# Deserialized cassettes by path, shared by every test in the session
+_CASSETTES = {}
+_CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+
+def _cassette_key(cassette_path, serializer):
+    return os.path.abspath(cassette_path), serializer.__name__
+
+
+class CachingPersister(FilesystemPersister):
+    """
+    Filesystem persister that reads and parses each cassette only once per session.
+    """
+    @classmethod
+    def load_cassette(cls, cassette_path, serializer):
+        key = _cassette_key(cassette_path, serializer)
+        if key not in _CASSETTES:
+            _CASSETTES[key] = super().load_cassette(cassette_path, serializer)
+        return _CASSETTES[key]
+
+    @staticmethod
+    def save_cassette(cassette_path, cassette_dict, serializer):
+        FilesystemPersister.save_cassette(cassette_path, cassette_dict, serializer)
+        _CASSETTES.pop(_cassette_key(cassette_path, serializer), None)
+
+
+# Response headers replay actually needs (JSON decoding and pagination); the rest is dropped on record
+_KEPT_RESPONSE_HEADERS = {"content-type", "link"}
+# Enough commits for every commit assertion (first message, max_commits=2)
+_MAX_RECORDED_COMMITS = 3
+
+
+def _trim_response(response):
+    """
+    Shrink a response before it is written to a cassette: keep only the headers in
+    _KEPT_RESPONSE_HEADERS and cut commit listings down to _MAX_RECORDED_COMMITS.
+    """
+    response["headers"] = {name: value for name, value in response["headers"].items()
+                           if name.lower() in _KEPT_RESPONSE_HEADERS}
+    body = response["body"]["string"]
+    try:
+        items = json.loads(body)
+    except ValueError:
+        return response
+    if isinstance(items, list) and items and "commit" in items[0]:
+        trimmed = json.dumps(items[:_MAX_RECORDED_COMMITS])
+        response["body"]["string"] = trimmed.encode() if isinstance(body, bytes) else trimmed
+    return response
+
+
+def pytest_recording_configure(config, vcr):
+    vcr.register_persister(CachingPersister)
+
+
+@pytest.fixture(scope="session")
+def warm_cassettes():
+    # Read and parse every cassette up front, in parallel, so VCR tests start from the in-memory copies
+    paths = [path for path in _CASSETTE_DIR.rglob("*.json") if _cassette_key(path, jsonserializer) not in _CASSETTES]
+    with ThreadPoolExecutor() as pool:
+        loaded = pool.map(lambda path: FilesystemPersister.load_cassette(path, jsonserializer), paths)
+        _CASSETTES.update(zip((_cassette_key(path, jsonserializer) for path in paths), loaded))
+
+
+@pytest.fixture(scope="session")
+def gh():
+    # One fake GitHub shared by every dummy-backed test; tests set `gh._repo` as needed
+    return DummyGithub("fake-token")
+
+
+@pytest.fixture(scope="class")
+def patched_github(gh):
+    # Patched once per test class rather than per test (VCR tests keep the real _get_page)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GITHUB_TOKEN", "fake-token")
+        mp.setattr("src.repo_miner._get_page", gh.get_page)
+        yield gh
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    # JSON cassettes replay noticeably faster than YAML ones; recordings are trimmed to what the tests read
+    return {
+        "serializer": "json",
+        "match_on": ["method", "scheme", "host", "path", "query"],
+        "filter_headers": ["authorization", "cookie", "user-agent"],
+        "before_record_response": _trim_response,
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_fetch_caches():
+    from src.repo_miner import _fetch_commits_cached, _fetch_issues_cached
+    # Each test serves its own data for the same repo names, so start from empty memos
+    _fetch_commits_cached.cache_clear()
+    _fetch_issues_cached.cache_clear()
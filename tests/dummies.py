@@ -1,42 +1,95 @@
 # --- Helpers for dummy GitHub API objects ---
 
+from dataclasses import InitVar, dataclass, field
+from datetime import datetime
+
+from yarl import URL
+
+@dataclass(slots=True, frozen=True)
 class DummyAuthor:
-    def __init__(self, name, email, date):
-        self.name = name
-        self.email = email
-        self.date = date
+    name: str
+    email: str
+    date: datetime
 
+@dataclass(slots=True, frozen=True)
 class DummyCommitCommit:
-    def __init__(self, author, message):
-        self.author = author
-        self.message = message
+    author: DummyAuthor
+    message: str
 
+@dataclass(slots=True)
 class DummyCommit:
-    def __init__(self, sha, author, email, date, message):
-        self.sha = sha
+    sha: str
+    author: InitVar[str]
+    email: InitVar[str]
+    date: InitVar[datetime]
+    message: InitVar[str]
+    commit: DummyCommitCommit = field(init=False)
+
+    def __post_init__(self, author, email, date, message):
         self.commit = DummyCommitCommit(DummyAuthor(author, email, date), message)
 
+    @property
+    def raw_data(self):
+        # commit as returned by GET /repos/{owner}/{repo}/commits
+        author = self.commit.author
+        return {
+            "sha": self.sha,
+            "commit": {
+                "author": {
+                    "name": author.name,
+                    "email": author.email,
+                    "date": author.date.isoformat() if author.date else None
+                },
+                "message": self.commit.message
+            }
+        }
+
+@dataclass(slots=True, frozen=True)
 class DummyUser:
-    def __init__(self, login):
-        self.login = login
+    login: str
 
+@dataclass(slots=True)
 class DummyIssue:
-    def __init__(self, id_, number, title, user, state, created_at, closed_at, comments, is_pr=False):
-        self.id = id_
-        self.number = number
-        self.title = title
-        self.user = DummyUser(user)
-        self.state = state
-        self.created_at = created_at
-        self.closed_at = closed_at
-        self.comments = comments
-        # attribute only on pull requests
-        self.pull_request = DummyUser("pr") if is_pr else None
+    id: int
+    number: int
+    title: str
+    login: InitVar[str]
+    state: str
+    created_at: datetime
+    closed_at: datetime
+    comments: int
+    is_pr: InitVar[bool] = False
+    user: DummyUser = field(init=False)
+    # attribute only on pull requests
+    pull_request: DummyUser = field(init=False, default=None)
 
+    def __post_init__(self, login, is_pr):
+        self.user = DummyUser(login)
+        if is_pr:
+            self.pull_request = DummyUser("pr")
+
+    @property
+    def raw_data(self):
+        # issue as returned by GET /repos/{owner}/{repo}/issues
+        data = {
+            "id": self.id,
+            "number": self.number,
+            "title": self.title,
+            "user": {"login": self.user.login},
+            "state": self.state,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "closed_at": self.closed_at.isoformat() if self.closed_at else None,
+            "comments": self.comments
+        }
+        # key only present on pull requests
+        if self.pull_request is not None:
+            data["pull_request"] = {"url": self.pull_request.login}
+        return data
+
+@dataclass(slots=True)
 class DummyRepo:
-    def __init__(self, commits, issues):
-        self._commits = commits
-        self._issues = issues
+    _commits: list
+    _issues: list
 
     def get_commits(self):
         return self._commits
@@ -50,8 +103,59 @@ class DummyRepo:
 class DummyGithub:
     def __init__(self, token, auth=None):
         assert token == "fake-token"
-    def get_repo(self, repo_name):
-        # ignore repo_name; return repo set in test fixture
-        return self._repo
-    def close(self):
-        pass # no-op for dummy
\ No newline at end of file
+        self.pages_served = []
+    async def get_page(self, session, url, params, limiter):
+        # stands in for repo_miner._get_page; serves the repo set in test fixture
+        url = URL(url).update_query(params)  # next links carry their own query
+        if url.path.endswith("/commits"):
+            items = self._repo.get_commits()
+        else:
+            items = self._repo.get_issues(state=url.query.get("state", "all"))
+        per_page, page = int(url.query["per_page"]), int(url.query["page"])
+        self.pages_served.append(page)
+        page_items = [item.raw_data for item in items[(page - 1) * per_page:page * per_page]]
+        last_page = max(1, -(-len(items) // per_page))
+        if url.path.endswith("/commits"):
+            return page_items, last_page, None
+        # Like GitHub's issues endpoint: no last page, only a cursor link to the next page
+        next_url = str(url.update_query(after=f"cursor{page}", page=page + 1)) if page < last_page else None
+        return page_items, None, next_url
+
+class DummyResponse:
+    def __init__(self, status, body=None, headers=None, last_page=None, next_url=None):
+        self.status = status
+        self._body = body
+        self.headers = headers or {}
+        # parsed Link header, shaped like aiohttp's ClientResponse.links
+        self.links = {}
+        if last_page is not None:
+            self.links["last"] = {"url": URL(f"https://api.github.com/any?per_page=100&page={last_page}")}
+        if next_url is not None:
+            self.links["next"] = {"url": URL(next_url)}
+    async def __aenter__(self):
+        return self
+    async def __aexit__(self, *exc_info):
+        pass
+    async def json(self):
+        return self._body
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+class DummySession:
+    def __init__(self, responses):
+        # responses are served in order, one per request, or by page number if given as a dict
+        self._responses = responses if isinstance(responses, dict) else list(responses)
+        self.requests = 0
+        self.pages = []
+        self.urls = []
+        self.last_headers = None
+    def get(self, url, params=None, headers=None):
+        self.requests += 1
+        self.urls.append(str(url))
+        self.last_headers = headers
+        page = (params or {}).get("page")
+        self.pages.append(page)
+        if isinstance(self._responses, dict):
+            return self._responses[page]
+        return self._responses.pop(0)
@@ -1,12 +1,24 @@
 # tests/test_repo_miner.py
 
-import os
-import pandas as pd
+import time
+import asyncio
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from src.config import COMMIT_COLUMNS, ISSUE_COLUMNS
-from src.repo_miner import fetch_commits, fetch_issues, merge_and_summarize
-from tests.dummies import DummyAuthor, DummyCommitCommit, DummyCommit, DummyUser, DummyIssue, DummyRepo, DummyGithub
+from tests.dummies import DummyCommit, DummyIssue, DummyRepo, DummyResponse, DummySession
+
+# pandas and src.repo_miner are imported inside the tests that need them, so collection stays fast
+
+# Expected column labels as object arrays, built once per module
+@pytest.fixture(scope="module")
+def commit_cols():
+    import numpy as np
+    return np.array(COMMIT_COLUMNS, dtype=object)
+
+@pytest.fixture(scope="module")
+def issue_cols():
+    import numpy as np
+    return np.array(ISSUE_COLUMNS, dtype=object)
 
 def is_iso8601_format(date_str: str) -> bool:
     try:
@@ -15,49 +27,231 @@ def is_iso8601_format(date_str: str) -> bool:
     except ValueError:
         return False
 
+# Fixed clock for dummy data, so results are the same on every run
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Dummy commits built once at import
+_COMMITS = [
+    DummyCommit("sha1", "Alice", "a@example.com", _NOW, "Initial commit\nDetails"),
+    DummyCommit("sha2", "Bob", "b@example.com", _NOW - timedelta(days=1), "Bug fix")
+]
+
+def make_commits(n, details=""):
+    # n dummy commits sha0..sha{n-1} by one author, all at _NOW
+    return [DummyCommit(f"sha{i}", "Alice", "a@example.com", _NOW, f"Commit {i}{details}") for i in range(n)]
+
+@pytest.fixture(scope="module")
+def dummy_repo():
+    return DummyRepo(_COMMITS, [])
+
+@pytest.fixture(params=[_COMMITS, [], make_commits(250)], ids=["basic", "empty", "large"])
+def dummy_commits(request):
+    return request.param
+
 # --- Tests for fetch_commits ---
+@pytest.mark.usefixtures("patched_github")
+@pytest.mark.xdist_group("dummies")
 class TestsWithDummies:
     
-    # Helper instance
-    gh_instance = DummyGithub("fake-token")
-    
-    @pytest.fixture(autouse=True)
-    def patch_env_and_github(self, monkeypatch):
-        # Set fake token
-        monkeypatch.setenv("GITHUB_TOKEN", "fake-token")
-        # Patch Github class'
-        monkeypatch.setattr("src.repo_miner.Github", lambda auth=None: self.gh_instance)
-        
-    
     # An example test case
-    def test_fetch_commits_basic(self, monkeypatch):
-        # Setup dummy commits
-        now = datetime.now()
-        commits = [
-            DummyCommit("sha1", "Alice", "a@example.com", now, "Initial commit\nDetails"),
-            DummyCommit("sha2", "Bob", "b@example.com", now - timedelta(days=1), "Bug fix")
-        ]
-        self.gh_instance._repo = DummyRepo(commits, [])
+    def test_dummy_basic_commits(self, gh, dummy_repo):
+        from src.repo_miner import fetch_commits
+        # Field normalization (the basic case's columns and order are covered by test_fetch_commits_param)
+        gh._repo = dummy_repo
         df = fetch_commits("any/repo")
-        assert list(df.columns) == COMMIT_COLUMNS
-        assert len(df) == 2
-        assert df.iloc[0]["message"] == "Initial commit"
-        
-    def test_fetch_issues_basic(self, monkeypatch):
-        now = datetime.now()
+        assert list(df["author"]) == ["Alice", "Bob"]
+        assert list(df["email"]) == ["a@example.com", "b@example.com"]
+        assert list(df["date"]) == ["2024-01-01T00:00:00+00:00", "2023-12-31T00:00:00+00:00"]
+        # Only the first line of each message is kept
+        assert list(df["message"]) == ["Initial commit", "Bug fix"]
+
+    def test_fetch_commits_param(self, gh, dummy_commits, commit_cols):
+        import numpy as np
+        from src.repo_miner import fetch_commits
+        gh._repo = DummyRepo(dummy_commits, [])
+        df = fetch_commits("any/repo")
+        assert np.array_equal(df.columns.to_numpy(), commit_cols)
+        # "large" spans three pages, fetched concurrently and stitched back together in order
+        assert list(df["sha"]) == [commit.sha for commit in dummy_commits]
+
+    def test_fetch_commits_limit_stops_paging(self, gh):
+        from src.repo_miner import _fetch_commits_cached
+        # Only the pages covering max_commits are requested
+        commits = make_commits(450)
+        gh._repo = DummyRepo(commits, [])
+        gh.pages_served = []
+        shas = _fetch_commits_cached("any/repo", 150)[COMMIT_COLUMNS.index("sha")]
+        assert len(shas) == 150
+        assert sorted(gh.pages_served) == [1, 2]
+
+    def test_fetch_commits_memoized(self, gh):
+        import pandas as pd
+        from src.repo_miner import fetch_commits
+        # A repeated fetch for the same (repo, max) is served from memory
+        commits = make_commits(5)
+        gh._repo = DummyRepo(commits, [])
+        gh.pages_served = []
+        first = fetch_commits("any/repo", max_commits=5)
+        second = fetch_commits("any/repo", max_commits=5)
+        pd.testing.assert_frame_equal(first, second)
+        assert gh.pages_served == [1]
+
+    def test_fetch_issues_basic(self, gh, issue_cols):
+        import numpy as np
+        import pandas as pd
+        from src.repo_miner import fetch_issues
+        now = _NOW
         issues = [
             DummyIssue(1, 101, "Issue A", "alice", "open", now, None, 0),
             DummyIssue(2, 102, "Issue B", "bob", "closed", (now - timedelta(days=2)), now, 2)
         ]
-        self.gh_instance._repo = DummyRepo([], issues)
+        gh._repo = DummyRepo([], issues)
         df = fetch_issues("any/repo", state="all")
-        assert list(df.columns) == ISSUE_COLUMNS
+        assert np.array_equal(df.columns.to_numpy(), issue_cols)
         assert len(df) == 2
         # Check date normalization
-        assert is_iso8601_format(df.iloc[0]["created_at"])
-        assert is_iso8601_format(df.iloc[1]["closed_at"])
+        assert is_iso8601_format(df["created_at"].iat[0])
+        assert is_iso8601_format(df["closed_at"].iat[1])
+        # Check open duration (NaN while still open)
+        assert pd.isna(df["open_duration_days"].iat[0])
+        assert df["open_duration_days"].iat[1] == 2
     
+    def test_fetch_issues_max_counts_issues_only(self, gh):
+        from src.repo_miner import fetch_issues
+        # max_issues counts issues, not the pull requests skipped along the way
+        now = _NOW
+        prs = [DummyIssue(i, i, f"PR {i}", "alice", "open", now, None, 0, is_pr=True) for i in range(100)]
+        issues = [DummyIssue(i, i, f"Issue {i}", "bob", "open", now, None, 0) for i in range(100, 150)]
+        gh._repo = DummyRepo([], prs + issues)
+        gh.pages_served = []
+        df = fetch_issues("any/repo", state="all", max_issues=10)
+        assert list(df["number"]) == list(range(100, 110))
+        # First page held only PRs, so exactly one more page was followed through its next link
+        assert sorted(gh.pages_served) == [1, 2]
+
+    def test_fetch_commits_to_csv_matches_dataframe(self, gh, tmp_path):
+        from src.repo_miner import fetch_commits, fetch_commits_to_csv
+        commits = make_commits(150, details="\nDetails")
+        gh._repo = DummyRepo(commits, [])
+        out = tmp_path / "commits.csv"
+        # Streamed CSV is identical to writing out the DataFrame
+        assert fetch_commits_to_csv("any/repo", out_path=out) == 150
+        assert out.read_text() == fetch_commits("any/repo").to_csv(index=False)
+
+    def test_fetch_commits_to_csv_zero_max(self, tmp_path):
+        from src.repo_miner import fetch_commits_to_csv
+        out = tmp_path / "commits.csv"
+        assert fetch_commits_to_csv("any/repo", max_commits=0, out_path=out) == 0
+        assert out.read_text().strip() == ",".join(COMMIT_COLUMNS)
+
+    def test_fetch_commits_to_csv_keeps_old_file_on_error(self, monkeypatch, tmp_path):
+        from src.repo_miner import fetch_commits_to_csv
+        async def not_found(session, url, params, limiter):
+            raise ValueError(f"`{url}` not found or inaccessible.")
+        monkeypatch.setattr("src.repo_miner._get_page", not_found)
+        out = tmp_path / "commits.csv"
+        out.write_text("previous contents\n")
+        with pytest.raises(ValueError):
+            fetch_commits_to_csv("missing/repo", out_path=out)
+        # The earlier CSV is untouched and no partial file is left behind
+        assert out.read_text() == "previous contents\n"
+        assert [path.name for path in tmp_path.iterdir()] == ["commits.csv"]
+
+    def test_fetch_issues_to_csv_matches_dataframe(self, gh, tmp_path):
+        from src.repo_miner import fetch_issues, fetch_issues_to_csv
+        now = _NOW
+        issues = [
+            DummyIssue(1, 101, "Issue A", "alice", "open", now, None, 0),
+            DummyIssue(2, 102, "Issue B", "bob", "closed", (now - timedelta(days=2)), now, 2),
+            DummyIssue(3, 103, "PR C", "carol", "open", now, None, 1, is_pr=True)
+        ]
+        gh._repo = DummyRepo([], issues)
+        out = tmp_path / "issues.csv"
+        assert fetch_issues_to_csv("any/repo", out_path=out) == 2
+        assert out.read_text() == fetch_issues("any/repo").to_csv(index=False)
+
+    def test_fetch_issues_to_csv_multiple_pages(self, gh, tmp_path):
+        from src.repo_miner import fetch_issues, fetch_issues_to_csv
+        # Page 1 is all closed issues, page 2 has an open one; durations must be written alike
+        closed = [DummyIssue(i, i, f"Issue {i}", "alice", "closed", _NOW - timedelta(days=2), _NOW, 0)
+                  for i in range(100)]
+        page_two = [
+            DummyIssue(100, 100, "Issue 100", "bob", "open", _NOW, None, 0),
+            DummyIssue(101, 101, "Issue 101", "bob", "closed", _NOW - timedelta(days=3), _NOW, 0)
+        ]
+        gh._repo = DummyRepo([], closed + page_two)
+        out = tmp_path / "issues.csv"
+        assert fetch_issues_to_csv("any/repo", out_path=out) == 102
+        text = out.read_text()
+        assert text == fetch_issues("any/repo").to_csv(index=False)
+        assert ",2.0," in text and ",3.0," in text
+
+    def test_write_csv_matches_columns_by_name(self, tmp_path):
+        from src.repo_miner import _write_csv
+        async def pages():
+            yield [{"a": 1, "b": 2}]
+        # Normalizer returns its columns in a different order than the header
+        normalize = lambda items: {"b": [item["b"] for item in items], "a": [item["a"] for item in items]}
+        out = tmp_path / "out.csv"
+        assert asyncio.run(_write_csv(pages(), out, ["a", "b"], normalize)) == 1
+        assert out.read_text().splitlines() == ["a,b", "1,2"]
+
+    def test_fetch_all_cli_writes_both_csvs(self, gh, monkeypatch, tmp_path, capsys):
+        from src.repo_miner import fetch_commits, fetch_issues, main
+        now = _NOW
+        commits = make_commits(120)
+        issues = [
+            DummyIssue(1, 101, "Issue A", "alice", "open", now, None, 0),
+            DummyIssue(2, 102, "PR B", "bob", "open", now, None, 1, is_pr=True)
+        ]
+        gh._repo = DummyRepo(commits, issues)
+        commits_out, issues_out = tmp_path / "commits.csv", tmp_path / "issues.csv"
+        monkeypatch.setattr("sys.argv", ["repo_miner", "fetch-all", "--repo", "any/repo",
+                                         "--commits-out", str(commits_out), "--issues-out", str(issues_out)])
+        main()
+        captured = capsys.readouterr().out
+        assert f"Saved 120 commits to {commits_out}" in captured
+        assert f"Saved 1 issues to {issues_out}" in captured
+        assert commits_out.read_text() == fetch_commits("any/repo").to_csv(index=False)
+        assert issues_out.read_text() == fetch_issues("any/repo").to_csv(index=False)
+
+    def test_fetch_all_keeps_both_files_when_one_fetch_fails(self, monkeypatch, tmp_path):
+        from src.repo_miner import fetch_all_to_csv
+        cancelled = []
+        async def get_page(session, url, params, limiter):
+            if url.endswith("/commits"):
+                try:
+                    await asyncio.Event().wait()  # still in flight when issues fail
+                except asyncio.CancelledError:
+                    cancelled.append(url)
+                    raise
+            raise ValueError(f"`{url}` not found or inaccessible.")
+        monkeypatch.setattr("src.repo_miner._get_page", get_page)
+        commits_out, issues_out = tmp_path / "commits.csv", tmp_path / "issues.csv"
+        commits_out.write_text("old commits\n")
+        issues_out.write_text("old issues\n")
+        with pytest.raises(ValueError):
+            fetch_all_to_csv("any/repo", commits_out=commits_out, issues_out=issues_out)
+        assert len(cancelled) == 1
+        assert commits_out.read_text() == "old commits\n"
+        assert issues_out.read_text() == "old issues\n"
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["commits.csv", "issues.csv"]
+
+    def test_read_github_token_once(self, monkeypatch, capsys):
+        from src.repo_miner import _read_github_token
+        monkeypatch.delenv("GITHUB_TOKEN")
+        _read_github_token.cache_clear()
+        try:
+            assert _read_github_token() is None
+            assert _read_github_token() is None
+            # Environment read (and warning printed) only once
+            assert capsys.readouterr().out.count("GITHUB_TOKEN environment variable not set") == 1
+        finally:
+            _read_github_token.cache_clear()
+
     def test_merge_and_summarize_output(self, capsys):
+        import pandas as pd
+        from src.repo_miner import merge_and_summarize
         # Prepare test DataFrames
         df_commits = pd.DataFrame({
             "sha": ["a", "b", "c", "d"],
@@ -89,59 +283,236 @@ class TestsWithDummies:
         # Check avg open duration
         assert "Avg. issue open duration: 0.00 days" in captured
 
+    @pytest.mark.parametrize("dtype", ["object", "string[pyarrow]"])
+    def test_merge_and_summarize_ties_in_first_appearance_order(self, capsys, dtype):
+        import pandas as pd
+        from src.repo_miner import merge_and_summarize
+        # Z and Y tie on 2 commits; Z appears first in the log, whatever the column's backend
+        df_commits = pd.DataFrame({"author": ["X", "Z", "X", "Y", "Y", "Z", "X"]}, dtype=dtype)
+        df_issues = pd.DataFrame({"state": ["open"], "open_duration_days": [float("nan")]})
+        merge_and_summarize(df_commits, df_issues)
+        captured = capsys.readouterr().out
+        assert captured.index("\tX: 3 commits") < captured.index("\tZ: 2 commits") < captured.index("\tY: 2 commits")
+
+    @pytest.mark.filterwarnings("error")
+    def test_merge_and_summarize_blank_durations(self, capsys):
+        import pandas as pd
+        from src.repo_miner import merge_and_summarize
+        # Closed issues whose durations are all missing average to NaN, without a warning
+        df_commits = pd.DataFrame({"author": ["X"]})
+        df_issues = pd.DataFrame({"state": ["closed", "open"], "open_duration_days": [float("nan")] * 2})
+        merge_and_summarize(df_commits, df_issues)
+        captured = capsys.readouterr().out
+        assert "Issue close rate: 0.50" in captured
+        assert "Avg. issue open duration: nan days" in captured
+
+    def test_summarize_cli_reads_csvs(self, monkeypatch, tmp_path, capsys):
+        from src.repo_miner import main
+        # CSVs written by the fetch commands are read back with typed (Arrow) columns
+        (tmp_path / "commits.csv").write_text(
+            "sha,author,email,date,message\n"
+            "a,X,x@e,2025-01-01T00:00:00+00:00,m1\n"
+            "b,Y,y@e,2025-01-01T01:00:00+00:00,m2\n"
+            "c,X,x@e,2025-01-02T00:00:00+00:00,m3\n")
+        (tmp_path / "issues.csv").write_text(
+            "id,number,title,user,state,created_at,closed_at,open_duration_days,comments\n"
+            "1,101,I1,u1,closed,2025-01-01T00:00:00+00:00,2025-01-03T00:00:00+00:00,2.0,0\n"
+            "2,102,I2,u2,open,2025-01-01T02:00:00+00:00,,,1\n")
+        monkeypatch.setattr("sys.argv", ["repo_miner", "summarize",
+                                         "--commits", str(tmp_path / "commits.csv"),
+                                         "--issues", str(tmp_path / "issues.csv")])
+        main()
+        captured = capsys.readouterr().out
+        assert "X: 2 commits" in captured
+        assert "Issue close rate: 0.50" in captured
+        assert "Avg. issue open duration: 2.00 days" in captured
+
+# --- Tests for the HTTP layer (session, page fetcher, rate limiter, ETag cache) with dummy responses ---
+class TestsWithDummyHttp:
+
+    def test_get_session_auth_header(self):
+        from src.repo_miner import get_session
+        async def session_headers(token):
+            async with get_session(token) as session:
+                return session.headers
+        # Token is sent as a bearer token, and omitted when not set
+        assert asyncio.run(session_headers("fake-token"))["Authorization"] == "Bearer fake-token"
+        assert "Authorization" not in asyncio.run(session_headers(None))
+
+    def test_get_page_retries_when_rate_limited(self):
+        from src.repo_miner import RateLimiter, _get_page
+        session = DummySession([
+            DummyResponse(429, headers={"Retry-After": "0"}),
+            DummyResponse(200, body=[{"sha": "sha1"}])
+        ])
+        items, _, _ = asyncio.run(_get_page(session, "url", {}, RateLimiter()))
+        assert items == [{"sha": "sha1"}]
+        assert session.requests == 2
+
+    def test_get_page_reads_last_page_from_link_header(self):
+        from src.repo_miner import RateLimiter, _get_page
+        session = DummySession([DummyResponse(200, body=[{"sha": "sha1"}], last_page=3)])
+        assert asyncio.run(_get_page(session, "url", {"page": 1}, RateLimiter())) == ([{"sha": "sha1"}], 3, None)
+
+    def test_get_page_reads_next_url_from_link_header(self):
+        from src.repo_miner import RateLimiter, _get_page
+        next_url = "https://api.github.com/repositories/1/issues?state=all&after=Y3Vyc29y&per_page=100&page=2"
+        session = DummySession([DummyResponse(200, body=[{"number": 1}], next_url=next_url)])
+        assert asyncio.run(_get_page(session, "url", {"page": 1}, RateLimiter())) == ([{"number": 1}], None, next_url)
+
+    def test_fetch_pages_requests_remaining_pages_in_one_wave(self):
+        from src.repo_miner import RateLimiter, _fetch_pages
+        # Page 1 advertises the last page, so pages 2 and 3 are requested together
+        session = DummySession({
+            1: DummyResponse(200, body=[{"n": i} for i in range(100)], last_page=3),
+            2: DummyResponse(200, body=[{"n": i} for i in range(100, 200)], last_page=3),
+            # full page: only the advertised last page (not a short page) ends the walk
+            3: DummyResponse(200, body=[{"n": i} for i in range(200, 300)], last_page=3),
+        })
+        items = asyncio.run(_fetch_pages(session, "url", {}, RateLimiter()))
+        assert [item["n"] for item in items] == list(range(300))
+        assert sorted(session.pages) == [1, 2, 3]
+
+    def test_fetch_pages_follows_next_links_without_last_page(self):
+        from src.repo_miner import RateLimiter, _fetch_pages
+        # Issues page by cursor: no last page is advertised, each page links to the next one
+        cursor_2 = "https://api.github.com/repositories/1/issues?state=all&after=Y3Vyc29yMQ&per_page=100&page=2"
+        cursor_3 = "https://api.github.com/repositories/1/issues?state=all&after=Y3Vyc29yMg&per_page=100&page=3"
+        session = DummySession([
+            DummyResponse(200, body=[{"n": i} for i in range(100)], next_url=cursor_2),
+            DummyResponse(200, body=[{"n": i} for i in range(100, 200)], next_url=cursor_3),
+            # full page: only a missing next link (not a short page) ends the walk
+            DummyResponse(200, body=[{"n": i} for i in range(200, 300)]),
+        ])
+        items = asyncio.run(_fetch_pages(session, "url", {"state": "all"}, RateLimiter()))
+        assert [item["n"] for item in items] == list(range(300))
+        # Later pages are requested from the cursor URLs as given, not rebuilt from page numbers
+        assert session.urls == ["url", cursor_2, cursor_3]
+
+    def test_get_page_raises_on_other_errors(self):
+        from src.repo_miner import RateLimiter, _get_page
+        # A 403 without rate-limit headers is a real error, not retried
+        session = DummySession([DummyResponse(403)])
+        with pytest.raises(RuntimeError):
+            asyncio.run(_get_page(session, "url", {}, RateLimiter()))
+        assert session.requests == 1
+
+    def test_get_page_reuses_etag_cache(self, monkeypatch, tmp_path):
+        from src.repo_miner import RateLimiter, EtagCache, _get_page
+        cache = EtagCache(tmp_path / "etags.json")
+        monkeypatch.setattr("src.repo_miner._etag_cache", cache)
+        session = DummySession([
+            DummyResponse(200, body=[{"sha": "sha1"}], headers={"ETag": '"abc"'}),
+            DummyResponse(304)
+        ])
+        first = asyncio.run(_get_page(session, "url", {"page": 1}, RateLimiter()))
+        # Second request is conditional and served from the cache on 304
+        second = asyncio.run(_get_page(session, "url", {"page": 1}, RateLimiter()))
+        assert session.last_headers == {"If-None-Match": '"abc"'}
+        assert second == first == ([{"sha": "sha1"}], None, None)
+        # Cache survives a round trip to disk
+        cache.save()
+        assert EtagCache(tmp_path / "etags.json").get(EtagCache.key("url", {"page": 1}))["etag"] == '"abc"'
+
+    def test_rate_limiter_adapts_to_headers(self):
+        from src.repo_miner import RateLimiter
+        limiter = RateLimiter(max_concurrency=64)
+        # Low remaining budget throttles concurrency
+        limiter.update({"X-RateLimit-Remaining": "3"})
+        assert limiter.limit == 3
+        # Plenty of budget restores it
+        limiter.update({"X-RateLimit-Remaining": "4000"})
+        assert limiter.limit == 64
+        # Exhausted budget pauses until the window resets
+        reset = int(time.time()) + 60
+        limiter.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})
+        assert limiter.limit == 1
+        assert limiter.resume_at > time.time()
+
 # --- Tests that hit real GitHub API (will be simulated with vcrpy) ---
+# Note: the cassettes are synthetic. They were converted by hand from the original PyGitHub
+# recordings: the first request of each is rewritten to this client's per_page=100 URL, but the
+# pages keep their recorded 30 items and GitHub's original Link headers. The issue cassettes
+# therefore carry only cursor `next` links (open_duration follows one); the commit cassettes have
+# no Link header, and the numbered-wave path is covered by TestsWithDummyHttp.
+# Re-record with --record-mode=rewrite to replace them with real responses.
+@pytest.mark.usefixtures("warm_cassettes")
 class TestsWithVCR:
     @pytest.mark.vcr
-    def test_fetch_commits_basic(self, monkeypatch):
+    @pytest.mark.default_cassette("hello_world.json")
+    def test_fetch_commits_basic_vcr(self, commit_cols):
         """ Basic fetch on well known small repo """
+        import numpy as np
+        from src.repo_miner import fetch_commits
         df = fetch_commits("octocat/Hello-World")
-        assert list(df.columns) == COMMIT_COLUMNS
+        assert np.array_equal(df.columns.to_numpy(), commit_cols)
         assert len(df) == 3
-        assert df.iloc[0]["message"] == "Merge pull request #6 from Spaceghost/patch-1"
+        assert df["message"].iat[0] == "Merge pull request #6 from Spaceghost/patch-1"
 
     @pytest.mark.vcr
-    def test_fetch_commits_limit(self, monkeypatch):
+    @pytest.mark.default_cassette("hello_world.json")
+    def test_fetch_commits_limit(self, commit_cols):
         """ More commits than max_commits. Test that fetch_commits respects the max_commits limit. """
+        import numpy as np
+        from src.repo_miner import fetch_commits
         df = fetch_commits("octocat/Hello-World", max_commits=2)
-        assert list(df.columns) == COMMIT_COLUMNS
+        assert np.array_equal(df.columns.to_numpy(), commit_cols)
         assert len(df) == 2
-        assert df.iloc[0]["message"] == "Merge pull request #6 from Spaceghost/patch-1"
+        assert df["message"].iat[0] == "Merge pull request #6 from Spaceghost/patch-1"
             
     @pytest.mark.vcr
-    def test_fetch_commits_empty(self, monkeypatch):
+    def test_fetch_commits_empty(self, commit_cols):
         """ Test that fetch_commits returns empty DataFrame when no max commits exist. """
+        import numpy as np
+        from src.repo_miner import fetch_commits
         # Uses a cassette modified so that it returns 0 commits
         df = fetch_commits("octocat/Hello-World")
-        assert list(df.columns) == COMMIT_COLUMNS
+        assert np.array_equal(df.columns.to_numpy(), commit_cols)
         assert len(df) == 0
         assert df.empty
     
     @pytest.mark.vcr()
-    def test_fetch_issues_PR_filtering(self, monkeypatch):
+    def test_fetch_issues_PR_filtering(self, issue_cols):
         """ Test that fetch issues filters out PRs."""
+        import numpy as np
+        from src.repo_miner import fetch_issues
         PR_issue_nums = [112, 106, 105, 104]
-        df = fetch_issues("talos-rit/commander", state="all", max_issues=17)
-        assert list(df.columns) == ISSUE_COLUMNS
+        # The 13 issues among the first 17 recorded items; more would follow the unrecorded next link
+        df = fetch_issues("talos-rit/commander", state="all", max_issues=13)
+        assert np.array_equal(df.columns.to_numpy(), issue_cols)
         # Check that none of the PR issue numbers from the recorded cassette are in the DataFrame
         for issue_num in PR_issue_nums:
             assert issue_num not in df["number"].values
     
     @pytest.mark.vcr()
-    def test_fetch_issues_correct_date_parsing(self, monkeypatch):
+    @pytest.mark.default_cassette("TestsWithVCR.test_fetch_issues_PR_filtering.json")
+    def test_fetch_issues_single_request(self, vcr):
+        """ Test that fetch issues reads everything from the list response, without a follow-up GET per issue. """
+        from src.repo_miner import fetch_issues
+        df = fetch_issues("talos-rit/commander", state="all", max_issues=13)
+        assert len(df) > 0
+        assert vcr.play_count == 1
+
+    @pytest.mark.vcr()
+    def test_fetch_issues_correct_date_parsing(self, issue_cols):
         """ Test that fetch issues correctly parses dates. Dates should be in ISO-8601 format if existing else None. """
-        df = fetch_issues("talos-rit/commander", state="all", max_issues=17)
+        import numpy as np
+        from src.repo_miner import fetch_issues
+        df = fetch_issues("talos-rit/commander", state="all", max_issues=13)
         # check that issue that hasn't been closed is None
-        assert df.iloc[0]["closed_at"] is None
+        assert df["closed_at"].iat[0] is None
         # Pick an issue that has both created at and closed at dates and check its dates are in ISO-8601 format
-        assert list(df.columns) == ISSUE_COLUMNS
-        assert is_iso8601_format(df.iloc[11]["created_at"])
-        assert is_iso8601_format(df.iloc[11]["closed_at"])
+        assert np.array_equal(df.columns.to_numpy(), issue_cols)
+        assert is_iso8601_format(df["created_at"].iat[11])
+        assert is_iso8601_format(df["closed_at"].iat[11])
     
     @pytest.mark.vcr()
-    def test_fetch_issues_open_duration(self, monkeypatch):
+    def test_fetch_issues_open_duration(self, issue_cols):
         """ Test that fetch issues correctly computes open_duration_days. """
+        import numpy as np
+        from src.repo_miner import fetch_issues
         expected_open_duration = 41 # days
         df = fetch_issues("talos-rit/commander", state="closed", max_issues=20)
-        assert list(df.columns) == ISSUE_COLUMNS
+        assert np.array_equal(df.columns.to_numpy(), issue_cols)
         # Test an issue that has been closed after being open for more than 0 or 1 days
-        assert df.iloc[2]["open_duration_days"] == expected_open_duration
+        assert df["open_duration_days"].iat[2] == expected_open_duration